@@ -4,12 +4,14 @@ Analyzes downloaded videos for visual and audio features.
 Optimized for batch processing with multiprocessing.
 """
 
+import hashlib
 import json
 import logging
 import multiprocessing as mp
 import os
+import sqlite3
 import time
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -18,6 +20,12 @@ from typing import Optional, List, Dict, Any, Callable, Tuple
 import cv2
 import numpy as np
 
+# Optional fast JSON backend (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # =============================================================================
 # Configuration
 # =============================================================================
@@ -75,6 +83,12 @@ class AnalysisConfig:
             result["sample_percentage"] = self.sample_percentage
         return result
 
+    def fingerprint(self) -> str:
+        """Short hash of every setting that affects analysis output."""
+        settings = asdict(self)
+        settings.pop("workers", None)  # Parallelism does not change results
+        return hashlib.blake2b(repr(sorted(settings.items())).encode(), digest_size=6).hexdigest()
+
 
 # Preset configurations
 # Frame counts optimized for modern GPUs (RTX 4060Ti or better)
@@ -254,6 +268,25 @@ class VideoAnalysisResult:
             result["scene_analysis"] = self.scene_analysis
         return result
 
+    @classmethod
+    def from_dict(cls, video_path: str, data: Dict[str, Any]) -> "VideoAnalysisResult":
+        """Rebuild a result from its to_dict() form."""
+        return cls(
+            video_path=video_path,
+            analyzed_at=data.get("analyzed_at", ""),
+            version=data.get("version", VideoAnalyzer.ANALYSIS_VERSION),
+            settings=data.get("settings", {}),
+            video_quality=data.get("video_quality", {}),
+            visual_metrics=data.get("visual_metrics", {}),
+            content_detection=data.get("content_detection", {}),
+            motion_analysis=data.get("motion_analysis", {}),
+            color_analysis=data.get("color_analysis", {}),
+            scene_analysis=data.get("scene_analysis", {}),
+            audio_metrics=data.get("audio_metrics", {}),
+            processing_time_ms=data.get("processing_time_ms", 0.0),
+            errors=data.get("errors", []),
+        )
+
 
 # =============================================================================
 # Core Analysis Functions
@@ -930,21 +963,46 @@ class VideoAnalyzer:
         """
         try:
             # Read existing metadata
-            with open(json_path, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            metadata = _read_json_file(json_path)
 
             # Add analysis results (convert numpy types to Python types)
             metadata["analysis"] = _convert_numpy_types(analysis.to_dict())
 
             # Write back
-            with open(json_path, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            _write_json_file(json_path, metadata)
 
             return True
         except Exception as e:
             self.logger.error(f"Failed to update {json_path}: {e}")
             return False
 
+    def update_metadata_files_bulk(
+        self,
+        updates: Dict[str, VideoAnalysisResult],
+        workers: int = 8
+    ) -> Dict[str, bool]:
+        """
+        Add analysis results to many metadata JSON files concurrently.
+
+        File updates are pure I/O, so a thread pool overlaps the reads and
+        writes across files.
+
+        Args:
+            updates: Dict mapping json_path -> analysis results to add
+            workers: Number of I/O threads
+
+        Returns:
+            Dict mapping json_path -> True if updated successfully
+        """
+        if not updates:
+            return {}
+
+        workers = max(1, min(workers, len(updates)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            written = executor.map(
+                lambda item: self.update_metadata_file(*item), updates.items()
+            )
+            return dict(zip(updates.keys(), written))
 
     def analyze_batch(
         self,
@@ -1050,6 +1108,25 @@ def _convert_numpy_types(obj):
         return obj
 
 
+def _read_json_file(path: str) -> Any:
+    """Load a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json_file(path: str, data: Any) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
 # =============================================================================
 # Worker Functions for Multiprocessing
 # =============================================================================
@@ -1104,6 +1181,162 @@ def _analyze_single_video(args: Tuple[str, Dict]) -> VideoAnalysisResult:
     return analyzer.analyze_video(video_path)
 
 
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+
+def _video_fingerprint(video_path: str, chunk_size: int = 65536) -> str:
+    """
+    Cheap content hash of a video: file size plus first and last chunk.
+
+    Args:
+        video_path: Path to video file
+        chunk_size: Bytes hashed from each end of the file
+
+    Returns:
+        Hex digest string
+    """
+    size = os.path.getsize(video_path)
+    digest = hashlib.blake2b(str(size).encode(), digest_size=16)
+
+    with open(video_path, "rb") as f:
+        digest.update(f.read(chunk_size))
+        if size > chunk_size:
+            f.seek(max(size - chunk_size, chunk_size))
+            digest.update(f.read(chunk_size))
+
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    SQLite cache of analysis results keyed by video content, config and
+    analyzer version (so bumping VideoAnalyzer.ANALYSIS_VERSION invalidates it).
+
+    Lets re-runs over the same library skip videos that were already
+    analyzed with identical settings.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        config: AnalysisConfig,
+        logger: Optional[logging.Logger] = None
+    ):
+        """
+        Open (or create) the cache database.
+
+        If the database cannot be opened the cache is disabled: lookups
+        return no hits and stores are skipped.
+
+        Args:
+            db_path: Path to the SQLite file
+            config: Analysis configuration used for this run
+            logger: Logger instance
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self._config_fp = f"{config.fingerprint()}-v{VideoAnalyzer.ANALYSIS_VERSION}"
+        self._keys: Dict[str, str] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self._conn = sqlite3.connect(str(db_path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL)"
+            )
+        except sqlite3.Error as e:
+            self.logger.warning(f"Analysis cache unavailable, analyzing all videos: {e}")
+            self.close()
+
+    def __enter__(self) -> "AnalysisCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def enabled(self) -> bool:
+        """True while the database connection is open."""
+        return self._conn is not None
+
+    def _key(self, video_path: str) -> str:
+        """Cache key for a video under the current config and analyzer version."""
+        if video_path not in self._keys:
+            self._keys[video_path] = _video_fingerprint(video_path) + self._config_fp
+        return self._keys[video_path]
+
+    def lookup(self, video_paths: List[str]) -> Dict[str, VideoAnalysisResult]:
+        """
+        Fetch cached results for the given videos.
+
+        A database error disables the cache and returns no hits.
+
+        Args:
+            video_paths: List of video file paths
+
+        Returns:
+            Dict mapping video_path -> cached VideoAnalysisResult (hits only)
+        """
+        if not self.enabled:
+            return {}
+
+        hits = {}
+        try:
+            for path in video_paths:
+                try:
+                    key = self._key(path)
+                except OSError:
+                    continue
+                row = self._conn.execute(
+                    "SELECT result FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    hits[path] = VideoAnalysisResult.from_dict(path, json.loads(row[0]))
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.warning(f"Analysis cache unreadable, analyzing all videos: {e}")
+            self.close()
+            return {}
+        return hits
+
+    def store(self, results: Dict[str, VideoAnalysisResult]) -> None:
+        """
+        Save results for later runs.
+
+        Results with errors are not cached, nor are results whose audio
+        analysis failed (_analyze_audio reports that in audio_metrics rather
+        than errors), so transient or missing-backend failures get retried.
+
+        Args:
+            results: Dict mapping video_path -> VideoAnalysisResult
+        """
+        if not self.enabled:
+            return
+
+        try:
+            for path, result in results.items():
+                if result.errors or "audio_error" in result.audio_metrics:
+                    continue
+                try:
+                    key = self._key(path)
+                except OSError:
+                    continue
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, result) VALUES (?, ?)",
+                    (key, json.dumps(_convert_numpy_types(result.to_dict()))),
+                )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Could not save results to analysis cache: {e}")
+
+    def close(self) -> None:
+        """Close the database connection (safe to call more than once)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -17,12 +17,99 @@ Usage:
 """
 
 import argparse
+import itertools
 import sys
 import time
 from pathlib import Path
+from types import SimpleNamespace
+
+from utils import (
+    extract_video_id,
+    find_downloaded_video_ids,
+    iter_clean_urls,
+    setup_logging,
+)
+
+BROWSER_CHOICES = ["chrome", "firefox", "edge", "opera", "brave", "chromium"]
+
+# Options understood by _fast_parse(), mapped to their argument names
+_FAST_VALUE_OPTIONS = {
+    "-i": "input", "--input": "input",
+    "-o": "output", "--output": "output",
+    "-b": "browser", "--browser": "browser",
+    "-l": "log", "--log": "log",
+}
+_FAST_FLAG_OPTIONS = {
+    "--no-browser": "no_browser",
+    "--analyze": "analyze",
+    "--analyze-only": "analyze_only",
+}
+
+
+def _fast_parse(argv: list[str]) -> SimpleNamespace | None:
+    """
+    Parse the common invocations without building the argparse parser.
+
+    Only handles the basic input/output/browser/log options and the
+    --no-browser/--analyze/--analyze-only flags. Defaults must match
+    parse_arguments().
+
+    Args:
+        argv: Full argument vector (sys.argv)
+
+    Returns:
+        Namespace equivalent to parse_arguments(), or None if any other
+        option (or an invalid value) is present
+    """
+    args = SimpleNamespace(
+        input="urls.txt",
+        output="videos",
+        browser="chrome",
+        log="errors.log",
+        no_browser=False,
+        download_workers=None,
+        analyze=False,
+        analyze_only=False,
+        thoroughness="balanced",
+        sample_frames=None,
+        sample_percent=None,
+        color_clusters=None,
+        motion_res=None,
+        face_model=None,
+        workers=None,
+        skip_audio=False,
+        no_cache=False,
+        scene_detection=False,
+        full_resolution=False,
+    )
+
+    tokens = iter(argv[1:])
+    for token in tokens:
+        if token in _FAST_FLAG_OPTIONS:
+            setattr(args, _FAST_FLAG_OPTIONS[token], True)
+        elif token in _FAST_VALUE_OPTIONS:
+            value = next(tokens, None)
+            if value is None or value.startswith("-"):
+                return None
+            setattr(args, _FAST_VALUE_OPTIONS[token], value)
+        else:
+            return None
 
-from scraper import TikTokScraper
-from utils import read_urls_from_file, setup_logging
+    if args.browser not in BROWSER_CHOICES:
+        return None
+
+    return args
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for integer options that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def parse_arguments():
@@ -36,6 +123,7 @@ Examples:
   python main.py -i links.txt           Use custom input file
   python main.py -o downloads/          Use custom output directory
   python main.py -b firefox             Use Firefox browser cookies
+  python main.py --download-workers 4   Limit to 4 parallel downloads
   python main.py --analyze              Download and analyze videos
   python main.py --analyze-only         Only analyze existing videos
   python main.py --thoroughness maximum GPU instance, best quality
@@ -57,7 +145,7 @@ Examples:
     parser.add_argument(
         "-b", "--browser",
         default="chrome",
-        choices=["chrome", "firefox", "edge", "opera", "brave", "chromium"],
+        choices=BROWSER_CHOICES,
         help="Browser to use for cookies (default: chrome)"
     )
 
@@ -73,6 +161,13 @@ Examples:
         help="Skip browser cookie initialization (for public videos only)"
     )
 
+    parser.add_argument(
+        "--download-workers",
+        type=_positive_int,
+        default=None,
+        help="Number of parallel downloads (default: 8)"
+    )
+
     # Analysis options
     analysis_group = parser.add_argument_group("Analysis Options")
 
@@ -143,6 +238,12 @@ Examples:
         help="Skip audio analysis (faster but less complete)"
     )
 
+    analysis_group.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every video, ignoring cached results from earlier runs"
+    )
+
     analysis_group.add_argument(
         "--scene-detection",
         action="store_true",
@@ -173,6 +274,7 @@ def print_summary(results: dict):
     print(f"  Total URLs:    {results['total']}")
     print(f"  Successful:    {results['success']}")
     print(f"  Failed:        {results['failed']}")
+    print(f"  Skipped:       {results.get('skipped', 0)}")
     print("=" * 50)
 
     if results["failed"] > 0:
@@ -190,12 +292,25 @@ def print_analysis_summary(summary: dict):
     print("  ANALYSIS SUMMARY")
     print("=" * 50)
     print(f"  Analyzed:      {summary['analyzed']}")
+    print(f"  Cached:        {summary['cached']}")
     print(f"  Failed:        {summary['failed']}")
     print(f"  Time:          {summary['elapsed_seconds']}s")
     print(f"  Speed:         {summary['videos_per_second']} videos/sec")
     print("=" * 50 + "\n")
 
 
+def _analysis_succeeded(result, written: bool) -> bool:
+    """
+    Decide whether an analysis result counts as a success.
+
+    Results with errors are still saved, and count as successful when they
+    contain some valid data (video quality info).
+    """
+    if not result.errors:
+        return written
+    return bool(result.video_quality)
+
+
 def run_analysis(args, logger) -> dict:
     """
     Run batch video analysis.
@@ -207,7 +322,7 @@ def run_analysis(args, logger) -> dict:
     Returns:
         Analysis summary dict
     """
-    from analyzer import VideoAnalyzer, get_config, find_videos_to_analyze
+    from analyzer import AnalysisCache, VideoAnalyzer, get_config, find_videos_to_analyze
 
     # Find videos to analyze
     videos = find_videos_to_analyze(args.output)
@@ -215,7 +330,7 @@ def run_analysis(args, logger) -> dict:
     if not videos:
         logger.warning("No videos found to analyze")
         print(f"\nNo videos found in {args.output}")
-        return {"analyzed": 0, "failed": 0, "elapsed_seconds": 0, "videos_per_second": 0}
+        return {"analyzed": 0, "cached": 0, "failed": 0, "elapsed_seconds": 0, "videos_per_second": 0}
 
     # Build configuration from args
     config = get_config(
@@ -231,10 +346,20 @@ def run_analysis(args, logger) -> dict:
         full_resolution=args.full_resolution if args.full_resolution else None,
     )
 
+    # Reuse results from earlier runs with the same video content and settings
+    video_paths = [v[0] for v in videos]
+    cache = None
+    cached_results = {}
+    if not args.no_cache:
+        cache = AnalysisCache(Path(args.output) / ".analysis_cache.sqlite", config, logger)
+        cached_results = cache.lookup(video_paths)
+    to_run = [path for path in video_paths if path not in cached_results]
+
     print(f"\n{'=' * 50}")
     print("  VIDEO ANALYSIS")
     print("=" * 50)
     print(f"  Videos found:  {len(videos)}")
+    print(f"  Cached:        {len(cached_results) if cache and cache.enabled else 'disabled'}")
     print(f"  Thoroughness:  {config.thoroughness}")
     # Show percentage or frame count
     if config.sample_percentage is not None:
@@ -255,62 +380,86 @@ def run_analysis(args, logger) -> dict:
 
     start_time = time.time()
 
-    # Progress callback
+    # Progress callback (throttled to ~10 updates/sec; one line per update when not a TTY)
+    is_tty = sys.stdout.isatty()
+    last_print = [0.0]
+    last_pct = [-1]
+
     def on_progress(completed, total):
         pct = completed * 100 // total
+        now = time.monotonic()
+        if completed != total and (pct == last_pct[0] or now - last_print[0] <= 0.1):
+            return
+        last_pct[0] = pct
+        last_print[0] = now
+
         bar_len = 30
-        filled = int(bar_len * completed / total)
-        bar = "=" * filled + "-" * (bar_len - filled)
-        print(f"\r  Progress: [{bar}] {completed}/{total} ({pct}%)", end="", flush=True)
+        filled = bar_len * completed // total
+        line = f"  Progress: [{'=' * filled}{'-' * (bar_len - filled)}] {completed}/{total} ({pct}%)"
+        sys.stdout.write(f"\r{line}" if is_tty else f"{line}\n")
+        sys.stdout.flush()
 
     print("\n  Starting analysis...\n")
 
-    # Run batch analysis
-    video_paths = [v[0] for v in videos]
+    # Run batch analysis on cache misses only
     results = analyzer.analyze_batch(
-        video_paths,
+        to_run,
         workers=config.workers,
         progress_callback=on_progress
     )
 
-    print()  # Newline after progress bar
+    if is_tty:
+        print()  # Newline after progress bar
+
+    if cache:
+        with cache:
+            cache.store(results)
+    results.update(cached_results)
 
     # Update JSON files with results
+    updates = {
+        json_path: results[video_path]
+        for video_path, json_path in videos
+        if video_path in results
+    }
+    written = analyzer.update_metadata_files_bulk(updates)
+
     success_count = 0
+    cached_count = 0
     fail_count = 0
 
     for video_path, json_path in videos:
-        if video_path in results:
-            result = results[video_path]
-            if not result.errors or len(result.errors) == 0:
-                if analyzer.update_metadata_file(json_path, result):
-                    success_count += 1
-                else:
-                    fail_count += 1
+        if video_path not in results:
+            fail_count += 1
+            continue
+
+        result = results[video_path]
+        if _analysis_succeeded(result, written.get(json_path, False)):
+            if video_path in cached_results:
+                cached_count += 1
             else:
-                # Still save results even with errors
-                analyzer.update_metadata_file(json_path, result)
-                if result.video_quality:  # Has some valid data
-                    success_count += 1
-                else:
-                    fail_count += 1
-                    logger.error(f"Analysis errors for {video_path}: {result.errors}")
+                success_count += 1
         else:
             fail_count += 1
+            if result.errors:
+                logger.error(f"Analysis errors for {video_path}: {result.errors}")
 
     elapsed = time.time() - start_time
 
     return {
         "analyzed": success_count,
+        "cached": cached_count,
         "failed": fail_count,
         "elapsed_seconds": round(elapsed, 2),
-        "videos_per_second": round(len(videos) / elapsed, 2) if elapsed > 0 else 0
+        # Speed covers freshly analyzed videos only; cache hits are near-instant
+        "videos_per_second": round(len(to_run) / elapsed, 2) if elapsed > 0 and to_run else 0
     }
 
 
 def main():
     """Main entry point."""
-    args = parse_arguments()
+    # Common invocations skip argparse; anything else gets full parsing
+    args = _fast_parse(sys.argv) or parse_arguments()
 
     print_banner()
 
@@ -326,6 +475,8 @@ def main():
             sys.exit(1)
         return
 
+    from scraper import TikTokScraper
+
     # Check input file exists
     input_path = Path(args.input)
     if not input_path.exists():
@@ -333,10 +484,25 @@ def main():
         print("Create the file and add TikTok URLs (one per line).")
         sys.exit(1)
 
-    # Read URLs from file
-    urls = read_urls_from_file(args.input)
-
-    if not urls:
+    # Stream URLs from disk, dropping duplicates and videos already saved
+    existing_ids = find_downloaded_video_ids(args.output)
+    seen = set()
+    total = 0
+
+    def pending_urls():
+        nonlocal total
+        for url in iter_clean_urls(args.input):
+            total += 1
+            video_key = extract_video_id(url) or url
+            if video_key in seen or video_key in existing_ids:
+                continue
+            seen.add(video_key)
+            yield url
+
+    urls = pending_urls()
+    first_url = next(urls, None)
+
+    if total == 0:
         print(f"\nNo URLs found in {args.input}")
         print("Add TikTok URLs to the file (one per line).")
         sys.exit(1)
@@ -344,25 +510,47 @@ def main():
     print(f"\nInput file:  {args.input}")
     print(f"Output dir:  {args.output}")
     print(f"Browser:     {args.browser}")
-    print(f"URLs found:  {len(urls)}")
 
-    # Initialize scraper
-    scraper = TikTokScraper(args.output, logger)
+    if first_url is not None:
+        # Initialize scraper
+        scraper = TikTokScraper(args.output, logger)
 
-    # Initialize browser (optional - will try but continue if it fails)
-    if args.no_browser:
-        print("\nSkipping browser initialization (--no-browser flag)")
-        print("Note: Only public videos will be accessible")
+        # Initialize browser (optional - will try but continue if it fails)
+        if args.no_browser:
+            print("\nSkipping browser initialization (--no-browser flag)")
+            print("Note: Only public videos will be accessible")
+        else:
+            print(f"\nAttempting to initialize {args.browser} browser cookies...")
+            scraper.initialize_browser(args.browser, required=False)
+            if not scraper._browser_initialized:
+                print("Warning: Browser cookies unavailable - continuing without authentication")
+                print("Public videos should still work. Private videos may fail.")
+
+        # Reuse connections across all downloads
+        scraper.init_http_pool(max_connections=32)
+
+        # Process URLs
+        print("\nStarting downloads...\n")
+        results = scraper.process_urls(
+            itertools.chain([first_url], urls), workers=args.download_workers
+        )
     else:
-        print(f"\nAttempting to initialize {args.browser} browser cookies...")
-        scraper.initialize_browser(args.browser, required=False)
-        if not scraper._browser_initialized:
-            print("Warning: Browser cookies unavailable - continuing without authentication")
-            print("Public videos should still work. Private videos may fail.")
-
-    # Process URLs
-    print("\nStarting downloads...\n")
-    results = scraper.process_urls(urls)
+        print("\nAll videos already downloaded - nothing to fetch")
+        results = {
+            "total": 0,
+            "success": 0,
+            "failed": 0,
+            "successful_urls": [],
+            "failed_urls": [],
+        }
+
+    # Counts are final once process_urls() has consumed the whole generator
+    skipped_count = total - len(seen)
+    print(f"\nURLs found:  {len(seen)} (of {total} lines, {skipped_count} duplicates/existing skipped)")
+
+    # Report against the full input list
+    results["total"] = total
+    results["skipped"] = skipped_count
 
     # Print summary
     print_summary(results)
@@ -2,14 +2,21 @@
 Core scraper logic for downloading TikTok videos and extracting metadata.
 """
 
+import http.cookiejar
+import inspect
+import itertools
 import json
 import os
 import shutil
 import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
 
 import pyktok as pyk
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from utils import (
     ensure_directory,
@@ -34,6 +41,49 @@ class TikTokScraper:
         self.output_dir = Path(output_dir)
         self.logger = logger
         self._browser_initialized = False
+        self._session: Optional[requests.Session] = None
+
+    def init_http_pool(self, max_connections: int = 32) -> requests.Session:
+        """
+        Create a shared pooled HTTP session for all metadata and video fetches.
+
+        pyktok calls ``requests.get`` directly, which opens a fresh TCP+TLS
+        connection per request. Routing those calls through one pooled
+        session lets repeated requests to tiktok.com / tiktokcdn.com reuse
+        connections. The session's cookie jar never stores cookies, so only
+        pyktok's explicit cookies= are sent, as with plain requests.get.
+        Safe to call more than once; the existing pool is reused.
+
+        Args:
+            max_connections: Maximum pooled connections kept per host
+
+        Returns:
+            The shared requests.Session
+        """
+        if self._session is not None:
+            return self._session
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=max_connections,
+            max_retries=Retry(total=3, backoff_factor=0.3),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Never keep Set-Cookie responses; requests stay stateless
+        session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+        # Point pyktok's module-level `requests` at the pooled session
+        pyktok_module = inspect.getmodule(pyk.save_tiktok)
+        if pyktok_module is not None and hasattr(pyktok_module, "requests"):
+            pyktok_module.requests = _PooledRequests(session)
+        else:
+            self.logger.warning("Could not attach HTTP pool to pyktok, using default connections")
+
+        self._session = session
+        self.logger.info(f"HTTP connection pool initialized (max {max_connections} connections)")
+        return session
 
     def initialize_browser(self, browser: str = "chrome", required: bool = False) -> bool:
         """
@@ -153,36 +203,97 @@ class TikTokScraper:
             self.logger.error(error_msg)
             return False, error_msg
 
-    def process_urls(self, urls: list[str]) -> dict:
+    def process_urls(self, urls: Iterable[str], workers: Optional[int] = None) -> dict:
         """
-        Process multiple URLs and track results.
+        Process multiple URLs in parallel and track results.
 
         Args:
-            urls: List of TikTok URLs to download
+            urls: TikTok URLs to download (any iterable, consumed once)
+            workers: Number of concurrent downloads (default: 8)
 
         Returns:
             Dictionary with success/failure counts and details
         """
         results = {
-            "total": len(urls),
+            "total": 0,
             "success": 0,
             "failed": 0,
             "successful_urls": [],
             "failed_urls": [],
         }
 
-        for i, url in enumerate(urls, 1):
-            self.logger.info(f"\n[{i}/{len(urls)}] Processing: {url}")
+        if workers is None:
+            workers = 8
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
+        # Keep a bounded window of downloads in flight so only the consumed
+        # part of the URL stream is ever held in memory
+        url_iter = iter(urls)
+        max_in_flight = 2 * workers
+        completed = 0
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            in_flight = {
+                executor.submit(self._process_one, url): url
+                for url in itertools.islice(url_iter, max_in_flight)
+            }
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    url = in_flight.pop(future)
+                    try:
+                        success, message = future.result()
+                    except Exception as e:
+                        success, message = False, f"Error downloading {url}: {e}"
+
+                    # Bookkeeping stays on this thread; workers only return tuples
+                    completed += 1
+                    if success:
+                        results["success"] += 1
+                        results["successful_urls"].append({"url": url, "message": message})
+                        self.logger.info(f"[{completed}] SUCCESS: {message}")
+                    else:
+                        results["failed"] += 1
+                        results["failed_urls"].append({"url": url, "error": message})
+                        self.logger.warning(f"[{completed}] FAILED: {message}")
+
+                # Refill the window from the URL stream
+                for url in itertools.islice(url_iter, len(done)):
+                    in_flight[executor.submit(self._process_one, url)] = url
+
+        results["total"] = completed
 
-            success, message = self.download_video(url)
+        return results
 
-            if success:
-                results["success"] += 1
-                results["successful_urls"].append({"url": url, "message": message})
-                self.logger.info(f"SUCCESS: {message}")
-            else:
-                results["failed"] += 1
-                results["failed_urls"].append({"url": url, "error": message})
-                self.logger.warning(f"FAILED: {message}")
+    def _process_one(self, url: str) -> Tuple[bool, str]:
+        """
+        Download a single URL from a worker thread.
 
-        return results
+        Args:
+            url: TikTok video URL
+
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        self.logger.info(f"Processing: {url}")
+        return self.download_video(url)
+
+
+class _PooledRequests:
+    """
+    Stand-in for the ``requests`` module that sends calls through a Session.
+
+    Request helpers (get, post, ...) go to the session so connections are
+    pooled; everything else (exceptions, utils, ...) falls back to ``requests``.
+    """
+
+    def __init__(self, session: requests.Session):
+        self._session = session
+
+    def __getattr__(self, name: str):
+        if name in ("get", "post", "head", "put", "patch", "delete", "options", "request"):
+            return getattr(self._session, name)
+        return getattr(requests, name)
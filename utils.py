@@ -8,6 +8,11 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
+
+# Precompiled URL patterns
+_VIDEO_ID_RE = re.compile(r"/video/(\d+)")
+_SHORT_URL_RE = re.compile(r"vm\.tiktok\.com/([A-Za-z0-9]+)")
 
 
 def setup_logging(log_file: str = "errors.log") -> logging.Logger:
@@ -74,12 +79,12 @@ def extract_video_id(url: str) -> str | None:
         Video ID string or None if not found
     """
     # Standard video URL pattern
-    match = re.search(r"/video/(\d+)", url)
+    match = _VIDEO_ID_RE.search(url)
     if match:
         return match.group(1)
 
     # Short URL pattern - return the short code
-    match = re.search(r"vm\.tiktok\.com/([A-Za-z0-9]+)", url)
+    match = _SHORT_URL_RE.search(url)
     if match:
         return match.group(1)
 
@@ -198,27 +203,67 @@ def format_metadata(raw_data: dict) -> dict:
     return formatted
 
 
-def read_urls_from_file(file_path: str) -> list[str]:
+def iter_clean_urls(file_path: str) -> Iterator[str]:
     """
-    Read TikTok URLs from a text file.
+    Stream TikTok URLs from a text file, one line at a time.
 
     Args:
         file_path: Path to the text file containing URLs
 
-    Returns:
-        List of URL strings (empty lines and comments ignored)
+    Yields:
+        URL strings (empty lines and comments skipped)
     """
-    urls = []
     path = Path(file_path)
 
     if not path.exists():
-        return urls
+        return
 
     with open(path, "r", encoding="utf-8") as f:
         for line in f:
             line = line.strip()
             # Skip empty lines and comments
             if line and not line.startswith("#"):
-                urls.append(line)
+                yield line
+
+
+def read_urls_from_file(file_path: str) -> list[str]:
+    """
+    Read TikTok URLs from a text file.
+
+    Args:
+        file_path: Path to the text file containing URLs
 
-    return urls
+    Returns:
+        List of URL strings (empty lines and comments ignored)
+    """
+    return list(iter_clean_urls(file_path))
+
+
+def find_downloaded_video_ids(output_dir: str | Path) -> set[str]:
+    """
+    Collect IDs of videos already saved under the output directory.
+
+    Videos are stored as {username}/{YYYY-MM-DD}/{video_id}.mp4, so the
+    file stem is the video ID. Uses os.scandir to avoid per-file stat calls.
+
+    Args:
+        output_dir: Base output directory
+
+    Returns:
+        Set of video ID strings (empty if the directory does not exist)
+    """
+    video_ids = set()
+    pending = [str(output_dir)]
+
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith(".mp4"):
+                        video_ids.add(entry.name[:-4].split("_")[-1])
+        except OSError:
+            continue
+
+    return video_ids